@@ -4,9 +4,13 @@
 1. 전처리: 리커트 척도 → 숫자 변환
 2. 분석: 문항별 평균 계산
 3. 리포팅: 템플릿에 결과 입력
+
+원본 CSV는 파일당 한 번만 읽고, 단계 사이에는 메모리의 DataFrame/결과를
+그대로 넘깁니다. (processed CSV, stats JSON은 산출물로 계속 저장)
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 
@@ -14,9 +18,49 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.preprocessing.convert_likert import process_all_files as convert_likert
-from src.analysis.calculate_stats import process_all_files as calculate_stats
-from src.reporting.fill_template import process_all_results as fill_template
+from src.preprocessing.convert_likert import read_raw_file, process_dataframe, save_processed_file
+from src.analysis.calculate_stats import calculate_stats_for_dataframe, save_results
+from src.reporting.fill_template import find_template, fill_template, print_verification_report
+from src.common.files import list_files
+from src.common.parallel import parallel_map
+from src.common.paths import DATA_DIR
+
+
+def run_pipeline(csv_file: Path, work_dir: Path, template_path: Path) -> bool:
+    """단일 원본 CSV 파일에 대해 전처리 → 분석 → 리포팅을 수행합니다.
+
+    template_path가 None이면 리포팅 단계는 건너뜁니다.
+    """
+    print(f"\n파일: {csv_file.name}")
+    print("-" * 50)
+
+    try:
+        # 1단계: 전처리
+        print("\n[1/3] 전처리: 리커트 척도 변환 중...")
+        df = read_raw_file(csv_file)
+        process_dataframe(df)
+        save_processed_file(df, work_dir / 'processed' / csv_file.name)
+
+        # 2단계: 분석 (변환된 DataFrame을 그대로 사용)
+        print("\n[2/3] 분석: 통계 계산 중...")
+        results = calculate_stats_for_dataframe(df, csv_file.name)
+        save_results(results, work_dir / 'results' / (csv_file.stem + '_stats.json'))
+
+        # 3단계: 리포팅 (통계 결과를 그대로 사용)
+        if template_path is None:
+            print("\n[3/3] 리포팅: 템플릿이 없어 건너뜁니다.")
+            return True
+
+        print("\n[3/3] 리포팅: 템플릿 작성 중...")
+        output_path = work_dir / 'output' / (csv_file.stem + '_결과.xlsx')
+        mapping_results = fill_template(template_path, results, output_path)
+        print_verification_report(mapping_results, output_path)
+
+        return True
+
+    except Exception as e:
+        print(f"  오류 발생: {e}")
+        return False
 
 
 def main():
@@ -32,20 +76,30 @@ def main():
     print(f"작업 폴더: {args.work_folder}")
     print("=" * 50)
 
-    # 1단계: 전처리
-    print("\n[1/3] 전처리: 리커트 척도 변환 중...")
-    convert_likert(args.work_folder)
+    work_dir = DATA_DIR / args.work_folder
+    if not work_dir.exists():
+        print(f"작업 폴더가 존재하지 않습니다: {args.work_folder}")
+        sys.exit(1)
 
-    # 2단계: 분석
-    print("\n[2/3] 분석: 통계 계산 중...")
-    calculate_stats(args.work_folder)
+    # 템플릿이 없어도 전처리/분석은 수행하고 리포팅만 건너뜀
+    template_path = find_template()
+    if template_path is not None:
+        print(f"템플릿: {template_path.name}")
 
-    # 3단계: 리포팅
-    print("\n[3/3] 리포팅: 템플릿 작성 중...")
-    fill_template(args.work_folder)
+    csv_files = list_files(work_dir / 'raw')
+    if not csv_files:
+        print(f"[{args.work_folder}] 변환할 CSV 파일이 없습니다.")
+        sys.exit(1)
+
+    print(f"[{args.work_folder}] {len(csv_files)}개의 파일을 처리합니다.")
+
+    outcomes = parallel_map(
+        functools.partial(run_pipeline, work_dir=work_dir, template_path=template_path),
+        csv_files,
+    )
 
     print("\n" + "=" * 50)
-    print("모든 처리 완료!")
+    print(f"모든 처리 완료! ({sum(outcomes)}/{len(csv_files)} 파일 성공)")
     print("=" * 50)
 
 
@@ -9,12 +9,12 @@
 """
 
 import argparse
-import json
+import functools
+import re
 import sys
 from pathlib import Path
 
 import pandas as pd
-import chardet
 
 # 프로젝트 루트를 path에 추가
 project_root = Path(__file__).parent.parent
@@ -22,13 +22,57 @@ sys.path.insert(0, str(project_root))
 
 from src.qualitative.preprocess import preprocess_responses, is_qualitative_column
 from src.qualitative.integrate import integrate_responses, format_output
+from src.common.csv_reader import read_csv
+from src.common.encoding import resolve_encoding
+from src.common.files import list_files
+from src.common.json_utils import write_json
+from src.common.parallel import parallel_map
+from src.common.paths import DATA_DIR
 
 
-def detect_encoding(file_path: Path) -> str:
-    """파일의 인코딩을 감지합니다."""
-    with open(file_path, 'rb') as f:
-        result = chardet.detect(f.read())
-    return result['encoding']
+# Excel 시트명에 사용할 수 없는 문자
+_SHEET_NAME_RE = re.compile(r'[\\/*?:\[\]]')
+
+# 숫자 값 패턴 (리커트 변환 컬럼 등)
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
+# 주관식 판별에서 제외할 컬럼명 키워드
+SKIP_COLUMN_KEYWORDS = ['타임스탬프', '법인', '소속', 'timestamp']
+
+# 주관식 후보 컬럼 사전 분류(숫자형 제외)에 읽을 앞부분 행 수
+CLASSIFY_SAMPLE_ROWS = 200
+
+
+def make_sheet_name(name: str, used_names: set) -> str:
+    """Excel 시트명 규칙에 맞게 정리한 이름을 반환합니다.
+
+    31자로 자르고, 앞뒤 작은따옴표를 제거하며, 대소문자만 다른 이름은
+    같은 시트로 취급되므로 used_names(소문자)와 겹치면 번호를 붙입니다.
+    """
+    base = _SHEET_NAME_RE.sub('', name)[:31].strip("'") or '질문'
+
+    sheet_name = base
+    number = 2
+    while sheet_name.lower() in used_names:
+        suffix = f" ({number})"
+        sheet_name = base[:31 - len(suffix)] + suffix
+        number += 1
+
+    used_names.add(sheet_name.lower())
+    return sheet_name
+
+
+def is_skipped_column(col: str) -> bool:
+    """타임스탬프, 법인 선택 등 주관식 대상이 아닌 컬럼인지 확인합니다."""
+    col_lower = col.lower()
+    return any(skip in col_lower for skip in SKIP_COLUMN_KEYWORDS)
+
+
+def is_numeric_sample(series: pd.Series) -> bool:
+    """표본의 비어있지 않은 값이 모두 숫자인지 확인합니다."""
+    values = series.dropna().str.strip()
+    values = values[values != '']
+    return len(values) > 0 and bool(values.str.fullmatch(_NUMBER_RE).all())
 
 
 def process_file(
@@ -37,9 +81,24 @@ def process_file(
     similarity_threshold: float = 0.4
 ) -> dict:
     """단일 CSV 파일을 처리합니다."""
-    # 파일 읽기
-    encoding = detect_encoding(input_path)
-    df = pd.read_csv(input_path, encoding=encoding)
+    print(f"\n파일: {input_path.name}")
+    print("-" * 40)
+
+    # 앞부분 표본으로 숫자형 컬럼(리커트 변환 문항 등)을 미리 제외한 뒤
+    # 나머지 컬럼만 문자열로 읽기
+    encoding = resolve_encoding(input_path)
+    sample = read_csv(input_path, encoding=encoding, nrows=CLASSIFY_SAMPLE_ROWS, dtype=str)
+    candidate_cols = [
+        col for col in sample.columns
+        if not is_skipped_column(col) and not is_numeric_sample(sample[col])
+    ]
+
+    # 후보 컬럼이 없어도 전체 응답 수는 필요하므로 첫 컬럼만 읽음
+    # (표본과 같은 파서로 읽어야 중복 헤더가 같은 이름('의견.1' 등)으로 바뀜)
+    df = read_csv(
+        input_path, encoding=encoding, engine='c',
+        usecols=candidate_cols or list(sample.columns[:1]), dtype=str,
+    )
 
     results = {
         'file': input_path.name,
@@ -48,14 +107,7 @@ def process_file(
     }
 
     # 주관식 컬럼 식별
-    qualitative_cols = []
-    for col in df.columns:
-        if is_qualitative_column(df[col]):
-            # 타임스탬프, 법인 선택 등 제외
-            col_lower = col.lower()
-            if any(skip in col_lower for skip in ['타임스탬프', '법인', '소속', 'timestamp']):
-                continue
-            qualitative_cols.append(col)
+    qualitative_cols = [col for col in candidate_cols if is_qualitative_column(df[col])]
 
     if not qualitative_cols:
         print("  주관식 컬럼을 찾을 수 없습니다.")
@@ -64,17 +116,18 @@ def process_file(
     # 출력 디렉토리 생성
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Excel 출력용 데이터
+    # Excel 출력용 데이터 (요약 시트명은 미리 예약)
     excel_sheets = {}
+    used_sheet_names = {'요약'}
 
     for col in qualitative_cols:
         print(f"\n  처리 중: {col[:50]}...")
 
-        # 응답 추출
-        responses = df[col].dropna().astype(str).str.strip().tolist()
-        responses = [r for r in responses if r]
+        # 응답 추출 (빈 문자열은 마스크로 한 번에 제외, 리스트 변환 없이 전달)
+        stripped = df[col].dropna().astype(str).str.strip()
+        responses = stripped[stripped != '']
 
-        if not responses:
+        if responses.empty:
             continue
 
         # 1단계: 전처리
@@ -114,35 +167,34 @@ def process_file(
             'items': integrated,
         }
 
-        # Excel 시트 데이터
-        sheet_data = []
-        for item in integrated:
-            sheet_data.append({
-                '통합 결과': item['display'],
-                '빈도': item['count'],
-                '원본 응답': ' | '.join(item['sources']) if item['count'] > 1 else '',
-            })
-
-        # 시트명 정리 (31자 제한, 특수문자 제거)
-        import re
-        safe_name = re.sub(r'[\\/*?:\[\]]', '', question_short)[:31]
+        # Excel 시트 데이터 (컬럼별 리스트로 구성)
+        sheet_data = {
+            '통합 결과': [item['display'] for item in integrated],
+            '빈도': [item['count'] for item in integrated],
+            '원본 응답': [
+                ' | '.join(item['sources']) if len(item['sources']) > 1 else ''
+                for item in integrated
+            ],
+        }
+
+        # 시트명 정리 (31자 제한, 특수문자 제거, 중복 방지)
+        safe_name = make_sheet_name(question_short, used_sheet_names)
         excel_sheets[safe_name] = pd.DataFrame(sheet_data)
 
-    # Excel 파일 저장
+    # Excel 파일 저장 (xlsxwriter: 셀 객체 트리 없이 바로 기록)
     excel_path = output_dir / f"{input_path.stem}_통합결과.xlsx"
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        # 요약 시트
-        summary_data = []
-        for q_name, q_data in results['questions'].items():
-            summary_data.append({
-                '질문': q_data['full_question'],
-                '원본 응답수': q_data['original_count'],
-                '제거된 응답수': q_data['removed_count'],
-                '유효 응답수': q_data['valid_count'],
-                '통합 후 항목수': q_data['integrated_count'],
-            })
-
-        if summary_data:
+    with pd.ExcelWriter(excel_path, engine='xlsxwriter') as writer:
+        # 요약 시트 (컬럼별 리스트로 구성)
+        questions = list(results['questions'].values())
+        summary_data = {
+            '질문': [q_data['full_question'] for q_data in questions],
+            '원본 응답수': [q_data['original_count'] for q_data in questions],
+            '제거된 응답수': [q_data['removed_count'] for q_data in questions],
+            '유효 응답수': [q_data['valid_count'] for q_data in questions],
+            '통합 후 항목수': [q_data['integrated_count'] for q_data in questions],
+        }
+
+        if questions:
             pd.DataFrame(summary_data).to_excel(writer, sheet_name='요약', index=False)
 
         # 각 질문별 시트
@@ -153,23 +205,25 @@ def process_file(
 
     # CSV 파일 저장 (통합 결과만)
     csv_path = output_dir / f"{input_path.stem}_통합결과.csv"
-    all_items = []
-    for q_name, q_data in results['questions'].items():
+    item_questions, item_displays, item_counts = [], [], []
+    for q_data in results['questions'].values():
         for item in q_data['items']:
-            all_items.append({
-                '질문': q_data['full_question'],
-                '통합 결과': item['display'],
-                '빈도': item['count'],
-            })
-
-    if all_items:
-        pd.DataFrame(all_items).to_csv(csv_path, index=False, encoding='utf-8-sig')
+            item_questions.append(q_data['full_question'])
+            item_displays.append(item['display'])
+            item_counts.append(item['count'])
+
+    if item_questions:
+        all_items = pd.DataFrame({
+            '질문': item_questions,
+            '통합 결과': item_displays,
+            '빈도': item_counts,
+        })
+        all_items.to_csv(csv_path, index=False, encoding='utf-8-sig')
         print(f"  CSV 저장: {csv_path.name}")
 
     # JSON 파일 저장 (상세 결과)
     json_path = output_dir / f"{input_path.stem}_통합결과.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    write_json(json_path, results)
     print(f"  JSON 저장: {json_path.name}")
 
     return results
@@ -205,8 +259,7 @@ def main():
     print(f"유사도 임계값: {args.threshold}")
 
     # 작업 폴더 확인
-    base_dir = Path(__file__).parent.parent
-    work_dir = base_dir / 'data' / args.work_folder
+    work_dir = DATA_DIR / args.work_folder
 
     if not work_dir.exists():
         print(f"\n오류: 작업 폴더가 존재하지 않습니다: {args.work_folder}")
@@ -222,7 +275,7 @@ def main():
     output_dir = work_dir / 'qualitative'
 
     # CSV 파일 처리
-    csv_files = list(input_dir.glob('*.csv'))
+    csv_files = list_files(input_dir)
 
     if not csv_files:
         print(f"\n처리할 CSV 파일이 없습니다.")
@@ -231,14 +284,10 @@ def main():
     print(f"\n{len(csv_files)}개 파일 처리 시작\n")
     print("=" * 60)
 
-    all_results = []
-
-    for csv_file in csv_files:
-        print(f"\n파일: {csv_file.name}")
-        print("-" * 40)
-
-        result = process_file(csv_file, output_dir, args.threshold)
-        all_results.append(result)
+    all_results = parallel_map(
+        functools.partial(process_file, output_dir=output_dir, similarity_threshold=args.threshold),
+        csv_files,
+    )
 
     # 최종 요약
     print("\n" + "=" * 60)
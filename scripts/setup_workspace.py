@@ -10,6 +10,7 @@ Inbound 폴더의 파일을 자동으로 처리하여 data 폴더 구조를 생
 """
 
 import argparse
+import os
 import sys
 import shutil
 from pathlib import Path
@@ -66,7 +67,12 @@ def process_file(file_path: Path, data_dir: Path, dry_run: bool = False, no_dele
         print(f"  파일 이동: inbound/{file_path.name} → data/{work_folder_name}/raw/{file_path.name}")
 
         if not dry_run:
-            shutil.move(str(file_path), str(destination))
+            try:
+                # 같은 파일시스템이면 복사 없이 이름만 변경 (원자적)
+                os.replace(file_path, destination)
+            except OSError:
+                # 다른 드라이브/파일시스템이면 복사 후 삭제
+                shutil.move(str(file_path), str(destination))
 
         print(f"  [완료]")
         return True
@@ -5,75 +5,122 @@
 - 결과를 JSON 파일로 저장
 """
 
-import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from ..common.csv_reader import read_csv
+from ..common.encoding import resolve_encoding
+from ..common.files import list_files
+from ..common.json_utils import write_json
+from ..common.parallel import parallel_map
+from ..common.paths import DATA_DIR
+from ..common.sampling import SAMPLE_ROWS
 
-def is_numeric_column(series: pd.Series) -> bool:
-    """해당 컬럼이 숫자형(리커트 척도 변환) 컬럼인지 확인합니다."""
-    non_empty = series.dropna()
-    if len(non_empty) == 0:
+
+def is_numeric_column(numeric: pd.Series, non_empty_count: int) -> bool:
+    """해당 컬럼이 숫자형(리커트 척도 변환) 컬럼인지 확인합니다.
+
+    Args:
+        numeric: 숫자로 변환된 컬럼 (변환 불가 값은 NaN)
+        non_empty_count: 변환 전 컬럼의 비어있지 않은 값 개수
+    """
+    if non_empty_count == 0:
         return False
 
-    try:
-        numeric_values = pd.to_numeric(non_empty, errors='coerce')
-        # 80% 이상이 숫자이고, 값이 1~5 범위인 경우
-        valid_count = numeric_values.dropna()
-        if len(valid_count) / len(non_empty) < 0.8:
-            return False
-        return valid_count.between(1, 5).all()
-    except:
+    # 앞부분 표본에 1~5 범위를 벗어난 값이 있으면 전체 검사 생략
+    if not numeric.iloc[:SAMPLE_ROWS].dropna().between(1, 5).all():
+        return False
+
+    # 80% 이상이 숫자이고, 값이 1~5 범위인 경우
+    valid_values = numeric.dropna()
+    if len(valid_values) / non_empty_count < 0.8:
         return False
+    return bool(valid_values.between(1, 5).all())
+
+
+def summarize_columns(values: np.ndarray) -> dict:
+    """숫자 배열(행: 응답, 열: 문항)의 열별 응답수/평균/최소/최대를 한 번에 계산합니다.
+
+    결측값(NaN)은 제외하며, 모든 열을 하나의 벡터 연산으로 처리합니다.
+    """
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    sums = np.where(valid, values, 0.0).sum(axis=0)
+
+    return {
+        'count': counts,
+        'mean': sums / np.maximum(counts, 1),
+        'min': np.where(valid, values, np.inf).min(axis=0, initial=np.inf),
+        'max': np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf),
+    }
 
 
 def calculate_stats_for_file(input_path: Path) -> dict:
     """CSV 파일의 각 문항별 통계를 계산합니다."""
-    df = pd.read_csv(input_path, encoding='utf-8-sig')
+    df = read_csv(input_path, encoding=resolve_encoding(input_path))
+    return calculate_stats_for_dataframe(df, input_path.name)
+
 
+def calculate_stats_for_dataframe(df: pd.DataFrame, file_name: str) -> dict:
+    """DataFrame의 각 문항별 통계를 계산합니다 (파일을 다시 읽지 않음)."""
     results = {
-        'file_name': input_path.name,
+        'file_name': file_name,
         'total_responses': len(df),
         'questions': []
     }
 
-    for col in df.columns:
-        if is_numeric_column(df[col]):
-            numeric_values = pd.to_numeric(df[col], errors='coerce').dropna()
-
-            question_stats = {
-                'question': col,
-                'mean': round(numeric_values.mean(), 2),
-                'count': int(len(numeric_values)),
-                'min': int(numeric_values.min()),
-                'max': int(numeric_values.max()),
-            }
-            results['questions'].append(question_stats)
+    # 숫자 변환은 파일당 한 번만 수행
+    num_df = df.apply(pd.to_numeric, errors='coerce')
+    non_empty_counts = df.notna().sum()
+
+    numeric_columns = [
+        col for col in num_df.columns
+        if is_numeric_column(num_df[col], non_empty_counts[col])
+    ]
+
+    # 숫자형 문항 전체를 하나의 배열로 모아 통계를 한 번에 계산
+    # (nullable 정수형 열의 결측값은 NaN으로 변환)
+    values = num_df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    summary = summarize_columns(values)
+
+    for idx, col in enumerate(numeric_columns):
+        question_stats = {
+            'question': col,
+            'mean': round(summary['mean'][idx], 2),
+            'count': int(summary['count'][idx]),
+            'min': int(summary['min'][idx]),
+            'max': int(summary['max'][idx]),
+        }
+        results['questions'].append(question_stats)
 
     return results
 
 
+def save_results(results: dict, output_path: Path):
+    """통계 결과를 출력하고 JSON 파일로 저장합니다."""
+    print(f"  총 응답: {results['total_responses']}개")
+    print(f"  분석된 문항: {len(results['questions'])}개")
+
+    # 결과 출력
+    print("\n  [문항별 평균]")
+    for q in results['questions']:
+        # 문항명 축약 (50자)
+        q_short = q['question'][:50] + "..." if len(q['question']) > 50 else q['question']
+        print(f"    {q['mean']:.2f} | {q_short}")
+
+    # JSON 파일로 저장
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output_path, results)
+
+
 def process_file(input_path: Path, output_path: Path) -> bool:
     """단일 파일을 처리하여 통계 결과를 저장합니다."""
     try:
         print(f"  분석 중: {input_path.name}")
 
         results = calculate_stats_for_file(input_path)
-
-        print(f"  총 응답: {results['total_responses']}개")
-        print(f"  분석된 문항: {len(results['questions'])}개")
-
-        # 결과 출력
-        print("\n  [문항별 평균]")
-        for q in results['questions']:
-            # 문항명 축약 (50자)
-            q_short = q['question'][:50] + "..." if len(q['question']) > 50 else q['question']
-            print(f"    {q['mean']:.2f} | {q_short}")
-
-        # JSON 파일로 저장
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        save_results(results, output_path)
 
         return True
 
@@ -82,14 +129,18 @@ def process_file(input_path: Path, output_path: Path) -> bool:
         return False
 
 
+def _process_job(job: tuple) -> bool:
+    """(입력 경로, 출력 경로) 작업을 처리합니다 (병렬 실행용)."""
+    return process_file(*job)
+
+
 def process_all_files(work_folder: str):
     """작업 폴더의 processed 폴더에 있는 모든 CSV 파일을 분석합니다.
 
     Args:
         work_folder: 작업 폴더명 (예: '2024_상반기_신입사원_입문과정')
     """
-    base_dir = Path(__file__).parent.parent.parent
-    work_dir = base_dir / 'data' / work_folder
+    work_dir = DATA_DIR / work_folder
 
     if not work_dir.exists():
         print(f"작업 폴더가 존재하지 않습니다: {work_folder}")
@@ -98,7 +149,7 @@ def process_all_files(work_folder: str):
     processed_dir = work_dir / 'processed'
     results_dir = work_dir / 'results'
 
-    csv_files = list(processed_dir.glob('*.csv'))
+    csv_files = list_files(processed_dir)
 
     if not csv_files:
         print(f"[{work_folder}] 분석할 CSV 파일이 없습니다.")
@@ -106,11 +157,12 @@ def process_all_files(work_folder: str):
 
     print(f"[{work_folder}] {len(csv_files)}개의 파일을 분석합니다.\n")
 
-    success_count = 0
-    for csv_file in csv_files:
-        output_file = results_dir / (csv_file.stem + '_stats.json')
+    jobs = [(csv_file, results_dir / (csv_file.stem + '_stats.json')) for csv_file in csv_files]
+    outcomes = parallel_map(_process_job, jobs)
 
-        if process_file(csv_file, output_file):
+    success_count = 0
+    for (csv_file, output_file), success in zip(jobs, outcomes):
+        if success:
             print(f"\n  저장됨: {output_file.name}\n")
             success_count += 1
         else:
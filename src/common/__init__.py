@@ -0,0 +1 @@
+# common 패키지
@@ -0,0 +1,28 @@
+"""
+CSV 읽기 모듈
+
+- pyarrow가 설치되어 있으면 멀티스레드 C++ 파서(engine='pyarrow') 사용
+- 없거나 pyarrow 엔진이 지원하지 않는 옵션(nrows 등)이면 pandas 기본 파서 사용
+- engine을 직접 지정하면 그 엔진을 사용
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+# pyarrow 엔진이 지원하지 않는 read_csv 옵션
+_PYARROW_UNSUPPORTED = {'nrows', 'chunksize', 'iterator', 'skipfooter'}
+
+
+def read_csv(file_path: Path, encoding: str, **kwargs) -> pd.DataFrame:
+    """CSV 파일을 DataFrame으로 읽습니다."""
+    if HAS_PYARROW and not (_PYARROW_UNSUPPORTED & kwargs.keys()):
+        kwargs.setdefault('engine', 'pyarrow')
+    return pd.read_csv(file_path, encoding=encoding, **kwargs)
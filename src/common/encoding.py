@@ -0,0 +1,71 @@
+"""
+파일 인코딩 감지 모듈
+
+- 파일 앞부분(최대 64KiB)만 읽어 인코딩 판별
+- UTF-8 BOM / ASCII 전용 파일은 chardet 없이 즉시 판별
+- 같은 실행 내 동일 파일은 결과를 재사용
+- 파이프라인이 직접 저장한 파일은 인코딩 기록 파일(.enc)로 감지 생략
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import Union
+
+import chardet
+
+
+# 인코딩 감지에 사용할 최대 바이트 수
+SAMPLE_SIZE = 64 * 1024
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# 인코딩 기록 파일 확장자 (예: 설문.csv → 설문.csv.enc)
+ENCODING_SUFFIX = '.enc'
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_cached(path: str, size: int, mtime_ns: int) -> str:
+    """파일 경로, 크기, 수정 시각을 키로 인코딩 감지 결과를 캐시합니다."""
+    with open(path, 'rb') as f:
+        sample = f.read(SAMPLE_SIZE)
+
+    # 멀티바이트 문자가 잘리지 않도록 마지막 줄바꿈까지만 사용
+    if len(sample) == SAMPLE_SIZE and b'\n' in sample:
+        sample = sample[:sample.rindex(b'\n') + 1]
+
+    if sample.startswith(UTF8_BOM):
+        return 'utf-8-sig'
+
+    # ASCII 전용이면 UTF-8로 읽어도 동일 (이후 구간의 한글도 대응)
+    if sample.isascii():
+        return 'utf-8'
+
+    return chardet.detect(sample)['encoding'] or 'utf-8'
+
+
+def detect_encoding(file_path: Union[str, Path]) -> str:
+    """파일의 인코딩을 감지합니다."""
+    stat = os.stat(file_path)
+    return _detect_cached(str(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+def encoding_sidecar_path(file_path: Union[str, Path]) -> Path:
+    """파일의 인코딩 기록 파일 경로를 반환합니다."""
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + ENCODING_SUFFIX)
+
+
+def write_encoding_sidecar(file_path: Union[str, Path], encoding: str):
+    """파일을 저장한 인코딩을 기록 파일에 남깁니다."""
+    encoding_sidecar_path(file_path).write_text(encoding, encoding='utf-8')
+
+
+def resolve_encoding(file_path: Union[str, Path]) -> str:
+    """기록된 인코딩이 있으면 사용하고, 없으면 감지합니다."""
+    sidecar = encoding_sidecar_path(file_path)
+    if sidecar.exists():
+        encoding = sidecar.read_text(encoding='utf-8').strip()
+        if encoding:
+            return encoding
+    return detect_encoding(file_path)
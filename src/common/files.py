@@ -0,0 +1,29 @@
+"""
+파일 목록 조회 모듈
+
+- os.scandir로 디렉토리를 한 번만 훑어 항목별 stat 재호출 방지
+- 작은 파일부터 정렬하여 병렬 처리 시 작업 분배를 고르게 함
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+
+def list_files(directory: Path, suffix: str = '.csv') -> List[Path]:
+    """디렉토리에서 확장자가 suffix인 파일 목록을 크기 오름차순으로 반환합니다.
+
+    확장자는 대소문자를 구분하지 않습니다 ('.CSV'도 포함).
+    디렉토리가 없으면 빈 리스트를 반환합니다.
+    """
+    if not os.path.isdir(directory):
+        return []
+
+    with os.scandir(directory) as entries:
+        files = [
+            entry for entry in entries
+            if entry.name.lower().endswith(suffix.lower()) and entry.is_file()
+        ]
+
+    files.sort(key=lambda entry: entry.stat().st_size)
+    return [Path(entry.path) for entry in files]
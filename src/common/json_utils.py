@@ -0,0 +1,18 @@
+"""
+JSON 저장 모듈
+
+- orjson(C 확장)으로 직렬화하여 한글이 많은 결과도 빠르게 저장
+- 출력 형식은 json.dump(ensure_ascii=False, indent=2)와 동일
+"""
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def write_json(path: Path, data: Any) -> None:
+    """데이터를 UTF-8 JSON 파일로 저장합니다 (들여쓰기 2칸, numpy 값 지원)."""
+    Path(path).write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
@@ -0,0 +1,31 @@
+"""
+파일 단위 병렬 처리 모듈
+
+- 파일별 처리는 서로 독립적이므로 여러 프로세스에서 동시에 실행
+- 처리할 항목이 하나뿐이면 프로세스 생성 비용 없이 현재 프로세스에서 실행
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+
+def parallel_map(func: Callable, items: Iterable, max_workers: Optional[int] = None) -> List:
+    """각 항목에 func를 병렬로 적용하고 결과를 입력 순서대로 반환합니다.
+
+    Args:
+        func: 모듈 최상위에 정의된 함수 (프로세스 간 전달 가능해야 함)
+        items: 처리할 항목들
+        max_workers: 최대 프로세스 수 (None이면 CPU 수)
+
+    Returns:
+        결과 리스트
+    """
+    items = list(items)
+    workers = min(len(items), max_workers or os.cpu_count() or 1)
+
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,17 @@
+"""
+프로젝트 경로 상수
+
+- 모듈 로드 시 한 번만 계산하여 재사용
+"""
+
+from pathlib import Path
+
+
+# 프로젝트 루트 (survey-result/)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 작업 폴더들이 위치하는 data 폴더
+DATA_DIR = PROJECT_ROOT / 'data'
+
+# 결과 입력용 템플릿 폴더
+TEMPLATES_DIR = PROJECT_ROOT / 'templates'
@@ -0,0 +1,8 @@
+"""
+표본 검사 설정 모듈
+
+- 컬럼 전체를 검사하기 전에 앞부분 표본으로 먼저 걸러낼 때 사용하는 행 수
+"""
+
+# 전체 검사 전에 먼저 확인할 앞부분 행 수
+SAMPLE_ROWS = 128
@@ -2,16 +2,17 @@
 CSV 파일을 ANSI(CP949) 인코딩으로 변환하는 스크립트
 """
 
-import os
-import chardet
+import sys
 from pathlib import Path
 
-
-def detect_encoding(file_path: str) -> str:
-    """파일의 인코딩을 감지합니다."""
-    with open(file_path, 'rb') as f:
-        result = chardet.detect(f.read())
-    return result['encoding']
+if __package__:
+    from ..common.encoding import detect_encoding
+    from ..common.files import list_files
+else:
+    # 스크립트로 직접 실행할 때는 프로젝트 루트를 path에 추가
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from src.common.encoding import detect_encoding
+    from src.common.files import list_files
 
 
 def convert_to_ansi(input_path: str, output_path: str) -> bool:
@@ -55,7 +56,7 @@ def process_all_files():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # CSV 파일 목록
-    csv_files = list(raw_dir.glob('*.csv'))
+    csv_files = list_files(raw_dir)
 
     if not csv_files:
         print("변환할 CSV 파일이 없습니다.")
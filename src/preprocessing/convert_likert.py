@@ -9,10 +9,16 @@
 - 매우 그렇지 않다 → 1
 """
 
-import chardet
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from ..common.csv_reader import read_csv
+from ..common.encoding import detect_encoding, write_encoding_sidecar
+from ..common.files import list_files
+from ..common.paths import DATA_DIR
+from ..common.sampling import SAMPLE_ROWS
+
 
 # 리커트 척도 변환 매핑
 LIKERT_MAP = {
@@ -24,65 +30,108 @@ LIKERT_MAP = {
 }
 
 # 리커트 척도 값 집합 (컬럼 식별용)
-LIKERT_VALUES = set(LIKERT_MAP.keys())
+LIKERT_VALUES = frozenset(LIKERT_MAP.keys())
+
 
+def sample_may_be_likert(series: pd.Series) -> bool:
+    """앞부분 표본만으로 리커트 척도 컬럼 가능성을 빠르게 확인합니다.
+
+    표본에 리커트 척도가 아닌 값이 하나라도 있으면 False를 반환하고,
+    그렇지 않으면 전체 검사가 필요하므로 True를 반환합니다.
+    """
+    head = series.iloc[:SAMPLE_ROWS].dropna().astype(str).str.strip()
+    head = head[head != '']
+    return bool(head.isin(LIKERT_VALUES).all())
 
-def detect_encoding(file_path: Path) -> str:
-    """파일의 인코딩을 감지합니다."""
-    with open(file_path, 'rb') as f:
-        result = chardet.detect(f.read())
-    return result['encoding']
+
+def strip_values(series: pd.Series) -> pd.Series:
+    """빈 값을 제외하고 앞뒤 공백을 정리한 값들을 범주형(category)으로 반환합니다.
+
+    리커트 척도 컬럼은 고유값이 5개 이하이므로, 이후 판별/변환은
+    행 단위가 아닌 범주(categories) 단위로 처리할 수 있습니다.
+    """
+    values = series.dropna().astype(str).str.strip()
+    return values[values != ''].astype('category')
+
+
+def is_likert_values(values: pd.Series) -> bool:
+    """정리된 값들이 모두 리커트 척도 값인지 확인합니다."""
+    if len(values) == 0:
+        return False
+
+    # 고유값(범주)만 확인
+    return bool(values.cat.categories.isin(LIKERT_VALUES).all())
 
 
 def is_likert_column(series: pd.Series) -> bool:
     """해당 컬럼이 리커트 척도 컬럼인지 확인합니다."""
-    # 빈 값이 아닌 값들만 확인
-    non_empty_values = series.dropna().astype(str).str.strip()
-    non_empty_values = non_empty_values[non_empty_values != '']
-
-    if len(non_empty_values) == 0:
+    if not sample_may_be_likert(series):
         return False
+    return is_likert_values(strip_values(series))
+
 
-    # 모든 비어있지 않은 값이 리커트 척도 값인지 확인
-    unique_values = set(non_empty_values.unique())
-    return unique_values.issubset(LIKERT_VALUES)
+def convert_likert_values(values: pd.Series, index: pd.Index) -> pd.Series:
+    """정리된 리커트 척도 값들을 숫자(Int8) 컬럼으로 변환합니다.
 
+    index에 없는 행(빈 값)은 결측값(NA)으로 채워집니다.
+    """
+    # 범주별 점수표(최대 5개)를 만든 뒤 범주 코드로 한 번에 조회
+    scores = values.cat.categories.map(LIKERT_MAP).to_numpy(dtype=np.int8)
+    converted = pd.Series(scores[values.cat.codes.to_numpy()], index=values.index, dtype='Int8')
+    return converted.reindex(index)
 
-def convert_likert_value(value) -> str:
-    """리커트 척도 텍스트를 숫자로 변환합니다."""
-    if pd.isna(value):
-        return value
 
-    str_value = str(value).strip()
-    if str_value in LIKERT_MAP:
-        return LIKERT_MAP[str_value]
-    return value
+def read_raw_file(input_path: Path) -> pd.DataFrame:
+    """원본 CSV 파일을 인코딩을 감지하여 읽습니다."""
+    encoding = detect_encoding(input_path)
+    print(f"  감지된 인코딩: {encoding}")
 
+    # 원본은 pandas 기본 파서로 읽음 (pyarrow 엔진은 중복 헤더를 'x.1'로 바꾸지 않고,
+    # 시간대가 있는 타임스탬프를 UTC로 바꿔 processed CSV에 그대로 기록됨)
+    df = read_csv(input_path, encoding=encoding, engine='c')
+    print(f"  총 {len(df)}개 응답, {len(df.columns)}개 컬럼")
 
-def process_file(input_path: Path, output_path: Path) -> bool:
-    """CSV 파일의 리커트 척도를 숫자로 변환합니다."""
-    try:
-        # 인코딩 감지 및 파일 읽기
-        encoding = detect_encoding(input_path)
-        print(f"  감지된 인코딩: {encoding}")
+    return df
+
+
+def process_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame의 리커트 척도 컬럼을 숫자로 변환합니다 (원본 DataFrame을 변경)."""
+    # 리커트 척도 컬럼 식별 및 변환
+    # (정리된 값을 한 번만 만들어 판별과 변환에 함께 사용)
+    likert_columns = []
+    for col in df.columns:
+        # 표본에서 이미 리커트 척도가 아니면 전체 검사 생략
+        if not sample_may_be_likert(df[col]):
+            continue
+
+        values = strip_values(df[col])
+        if is_likert_values(values):
+            likert_columns.append(col)
+            df[col] = convert_likert_values(values, df.index)
 
-        df = pd.read_csv(input_path, encoding=encoding)
-        print(f"  총 {len(df)}개 응답, {len(df.columns)}개 컬럼")
+    print(f"  변환된 리커트 척도 컬럼: {len(likert_columns)}개")
 
-        # 리커트 척도 컬럼 식별 및 변환
-        likert_columns = []
-        for col in df.columns:
-            if is_likert_column(df[col]):
-                likert_columns.append(col)
-                df[col] = df[col].apply(convert_likert_value)
+    return df
 
-        print(f"  변환된 리커트 척도 컬럼: {len(likert_columns)}개")
 
-        # 출력 디렉토리 생성
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+def save_processed_file(df: pd.DataFrame, output_path: Path):
+    """변환된 DataFrame을 CSV 파일로 저장합니다."""
+    # 출력 디렉토리 생성
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # UTF-8로 저장 (pandas 기본 처리)
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    # UTF-8로 저장 (pandas 기본 처리)
+    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+    # 이후 단계에서 인코딩 감지를 생략할 수 있도록 기록
+    write_encoding_sidecar(output_path, 'utf-8-sig')
+
+
+def process_file(input_path: Path, output_path: Path) -> bool:
+    """CSV 파일의 리커트 척도를 숫자로 변환합니다."""
+    try:
+        df = read_raw_file(input_path)
+        process_dataframe(df)
+        save_processed_file(df, output_path)
 
         return True
 
@@ -97,8 +146,7 @@ def process_all_files(work_folder: str):
     Args:
         work_folder: 작업 폴더명 (예: '2024_상반기_신입사원_입문과정')
     """
-    base_dir = Path(__file__).parent.parent.parent
-    work_dir = base_dir / 'data' / work_folder
+    work_dir = DATA_DIR / work_folder
 
     if not work_dir.exists():
         print(f"작업 폴더가 존재하지 않습니다: {work_folder}")
@@ -107,7 +155,7 @@ def process_all_files(work_folder: str):
     raw_dir = work_dir / 'raw'
     output_dir = work_dir / 'processed'
 
-    csv_files = list(raw_dir.glob('*.csv'))
+    csv_files = list_files(raw_dir)
 
     if not csv_files:
         print(f"[{work_folder}] 변환할 CSV 파일이 없습니다.")
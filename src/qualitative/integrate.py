@@ -16,8 +16,9 @@
 
 import re
 from typing import List, Dict, Tuple, Set
-from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+import numpy as np
 
 
 # 주제별 키워드 그룹 정의
@@ -47,6 +48,27 @@ SYNONYM_GROUPS = [
     ['견학', '현장견학', '현장 견학'],
 ]
 
+
+def _compile_alternation(words: List[str]) -> re.Pattern:
+    """단어 중 하나라도 포함되는지 한 번의 스캔으로 확인하는 정규식을 만듭니다 (소문자 기준)."""
+    return re.compile('|'.join(re.escape(word.lower()) for word in words))
+
+
+# 그룹마다 키워드를 하나의 alternation으로 컴파일
+# (그룹 전체를 하나로 합치면 겹치는 키워드의 그룹을 놓칠 수 있어 그룹별로 유지)
+_TOPIC_GROUP_RES = {
+    group_name: _compile_alternation(keywords)
+    for group_name, keywords in KEYWORD_GROUPS.items()
+}
+_SYNONYM_GROUP_RES = [_compile_alternation(synonyms) for synonyms in SYNONYM_GROUPS]
+
+# 대표 문장 선택 시 가산점을 주는 구체적 표현 (중복된 항목은 그만큼 더 가산)
+CONCRETE_PATTERNS = ['통해', '배울', '알게', '이해', '향상', '느낌', '느낌', '경험']
+_COMPLETE_ENDING_RE = re.compile(r'(음|함|됨|임)$')
+
+# 단어/공백/한글 외 문자 (키워드 추출과 유사도 비교 전 정규화에 사용)
+_NON_WORD_RE = re.compile(r'[^\w\s가-힣]')
+
 # 불용어 (키워드 추출 시 제외)
 STOPWORDS = {
     '이', '가', '을', '를', '은', '는', '에', '에서', '으로', '로',
@@ -66,8 +88,7 @@ def extract_keywords(text: str) -> Set[str]:
         return set()
 
     # 정규화
-    normalized = text.lower().strip()
-    normalized = re.sub(r'[^\w\s가-힣]', ' ', normalized)
+    normalized = _NON_WORD_RE.sub(' ', text.lower().strip())
 
     # 단어 분리 (2글자 이상)
     words = set(w for w in normalized.split() if len(w) >= 2)
@@ -78,33 +99,135 @@ def extract_keywords(text: str) -> Set[str]:
     return keywords
 
 
+def char_bigrams(text: str) -> Set[str]:
+    """문자열의 글자 bigram 집합을 반환합니다."""
+    return {text[k:k + 2] for k in range(len(text) - 1)}
+
+
+class KeywordIndex:
+    """응답별 원소(키워드, 글자 bigram 등) 집합을 번호로 바꿔 한 번만 만들어 두는 색인.
+
+    - row_sets: 응답별 원소 번호 집합 (교집합/부분집합 비교용)
+    - postings: 원소별로 그 원소를 가진 응답 번호 배열
+    - sizes: 응답별 원소 수
+    """
+
+    def __init__(self, feature_sets: List[Set[str]]):
+        self.vocab = {}
+        self.row_sets = []
+        postings = []
+
+        for i, features in enumerate(feature_sets):
+            ids = []
+            for feature in features:
+                fid = self.vocab.setdefault(feature, len(self.vocab))
+                if fid == len(postings):
+                    postings.append([])
+                postings[fid].append(i)
+                ids.append(fid)
+            self.row_sets.append(frozenset(ids))
+
+        self.postings = [np.array(rows, dtype=np.int64) for rows in postings]
+        self.sizes = np.array([len(ids) for ids in self.row_sets], dtype=np.int64)
+
+    def overlap_row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """i번째 응답과 모든 응답의 공통 원소 수와 Jaccard 유사도를 계산합니다.
+
+        i번째 응답이 가진 원소의 postings만 모아 세므로,
+        원소를 하나도 공유하지 않는 응답 쌍은 들여다보지 않습니다.
+
+        Returns:
+            (공통 원소 수 배열, Jaccard 유사도 배열) - 둘 다 길이 = 응답 수
+        """
+        sizes = self.sizes
+        ids = self.row_sets[i]
+
+        if ids:
+            hits = np.concatenate([self.postings[fid] for fid in ids])
+            common = np.bincount(hits, minlength=len(sizes))
+        else:
+            common = np.zeros(len(sizes), dtype=np.int64)
+
+        union = sizes[i] + sizes - common
+        jaccard = np.divide(common, union, out=np.zeros(len(sizes)), where=union > 0)
+
+        return common, jaccard
+
+
+def build_similarity_context(responses: List[str]) -> Dict:
+    """응답 간 비교에 필요한 응답별 파생 값과 키워드 정보를 미리 계산합니다.
+
+    비교 루프 안에서 같은 문자열에 lower()/re.sub/extract_keywords를
+    반복하지 않도록, 응답 인덱스로 조회하는 리스트로 만들어 둡니다.
+    키워드는 한 번만 추출해 KeywordIndex에 두고 모든 비교에서 재사용하며,
+    키워드/bigram 겹침은 전체 행렬 대신 postings로 기준 응답 한 행씩 계산합니다.
+
+    Returns:
+        {'responses': 응답 리스트, 'lower': 소문자 문자열,
+         'norm': 특수문자를 제거한 정규화 문자열,
+         'topics': 주제 그룹 집합, 'synonym_ids': 동의어 그룹 번호 집합,
+         'is_short': 짧은 응답 여부,
+         'keyword_index': 키워드 색인, 'bigram_index': 글자 bigram 색인,
+         'row': 마지막으로 계산한 기준 응답의 겹침 행 (캐시)}
+    """
+    lower = [resp.lower() for resp in responses]
+    norm = [_NON_WORD_RE.sub('', text) for text in lower]
+
+    return {
+        'responses': responses,
+        'lower': lower,
+        'norm': norm,
+        'topics': [frozenset(get_topic_group(resp)) for resp in responses],
+        'synonym_ids': [synonym_group_ids(text) for text in lower],
+        'is_short': [is_short_response(resp) for resp in responses],
+        'keyword_index': KeywordIndex([extract_keywords(resp) for resp in responses]),
+        'bigram_index': KeywordIndex([char_bigrams(text) for text in norm]),
+        'row': None,
+    }
+
+
+def _pair_overlap(context: Dict, i: int, j: int) -> Tuple[int, float, float]:
+    """i, j번째 응답의 (공통 키워드 수, 키워드 Jaccard, bigram Jaccard)를 반환합니다.
+
+    통합 루프는 한 기준 응답을 여러 응답과 연달아 비교하므로,
+    기준 응답의 겹침 행을 한 번 계산해 다음 비교에 재사용합니다.
+    """
+    row = context['row']
+    if row is not None and row[0] == j:
+        i, j = j, i
+    elif row is None or row[0] != i:
+        common, keyword_jaccard = context['keyword_index'].overlap_row(i)
+        _, bigram_jaccard = context['bigram_index'].overlap_row(i)
+        row = context['row'] = (i, common, keyword_jaccard, bigram_jaccard)
+
+    return row[1][j], row[2][j], row[3][j]
+
+
 def get_topic_group(text: str) -> List[str]:
     """텍스트가 속하는 주제 그룹을 반환합니다."""
     text_lower = text.lower()
-    matched_groups = []
-
-    for group_name, keywords in KEYWORD_GROUPS.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                matched_groups.append(group_name)
-                break
 
-    return matched_groups
+    return [
+        group_name
+        for group_name, pattern in _TOPIC_GROUP_RES.items()
+        if pattern.search(text_lower)
+    ]
 
 
 def are_synonyms(text1: str, text2: str) -> bool:
     """두 텍스트가 동의어 관계인지 확인합니다."""
-    text1_lower = text1.lower().strip()
-    text2_lower = text2.lower().strip()
-
-    for synonyms in SYNONYM_GROUPS:
-        synonyms_lower = [s.lower() for s in synonyms]
-        match1 = any(syn in text1_lower for syn in synonyms_lower)
-        match2 = any(syn in text2_lower for syn in synonyms_lower)
-        if match1 and match2:
-            return True
+    ids1 = synonym_group_ids(text1.lower().strip())
+    ids2 = synonym_group_ids(text2.lower().strip())
+    return not ids1.isdisjoint(ids2)
 
-    return False
+
+def synonym_group_ids(text_lower: str) -> frozenset:
+    """소문자 텍스트가 포함하는 동의어 그룹 번호(SYNONYM_GROUPS 인덱스) 집합을 반환합니다."""
+    return frozenset(
+        group_id
+        for group_id, pattern in enumerate(_SYNONYM_GROUP_RES)
+        if pattern.search(text_lower)
+    )
 
 
 def is_short_response(text: str) -> bool:
@@ -145,85 +268,97 @@ def short_contained_in_long(short: str, long: str) -> bool:
     return False
 
 
+def _short_contained_in_long(context: Dict, short: int, long: int) -> bool:
+    """미리 계산된 값으로 short번째 응답이 long번째 응답에 포함되는지 확인합니다."""
+    short_lower = context['lower'][short]
+    long_lower = context['lower'][long]
+
+    # 짧은 응답 자체가 포함되면 True
+    if short_lower in long_lower:
+        return True
+
+    # 동의어 확인
+    if not context['synonym_ids'][short].isdisjoint(context['synonym_ids'][long]):
+        return True
+
+    # 짧은 응답의 모든 키워드가 긴 응답에 포함되면 True
+    keyword_sets = context['keyword_index'].row_sets
+    return bool(keyword_sets[short]) and keyword_sets[short] <= keyword_sets[long]
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """두 텍스트의 유사도를 계산합니다 (0~1)."""
-    if not text1 or not text2:
+    return _calculate_similarity(build_similarity_context([text1, text2]), 0, 1)
+
+
+def _calculate_similarity(context: Dict, i: int, j: int) -> float:
+    """미리 계산된 키워드 정보로 i번째와 j번째 응답의 유사도를 계산합니다."""
+    if not context['responses'][i] or not context['responses'][j]:
         return 0.0
 
-    # 정규화
-    norm1 = re.sub(r'[^\w\s가-힣]', '', text1.lower())
-    norm2 = re.sub(r'[^\w\s가-힣]', '', text2.lower())
+    norm1 = context['norm'][i]
+    norm2 = context['norm'][j]
 
     if norm1 == norm2:
         return 1.0
 
-    # 키워드 기반 유사도
-    kw1 = extract_keywords(text1)
-    kw2 = extract_keywords(text2)
-
-    if not kw1 or not kw2:
+    # 키워드 기반 유사도 (Jaccard)
+    keyword_sets = context['keyword_index'].row_sets
+    if not keyword_sets[i] or not keyword_sets[j]:
         return 0.0
 
-    # Jaccard 유사도
-    intersection = len(kw1 & kw2)
-    union = len(kw1 | kw2)
-    keyword_sim = intersection / union if union > 0 else 0
-
-    # 문자열 유사도
-    string_sim = SequenceMatcher(None, norm1, norm2).ratio()
+    # 문자열 유사도 (글자 bigram Jaccard)
+    _, keyword_sim, string_sim = _pair_overlap(context, i, j)
 
     # 가중 평균 (키워드 60%, 문자열 40%)
     return keyword_sim * 0.6 + string_sim * 0.4
 
 
-def select_representative(responses: List[str]) -> str:
-    """통합된 응답 중 대표 문장을 선택합니다.
+def representative_scores(responses: List[str], keyword_counts: List[int]) -> np.ndarray:
+    """대표 문장 선택 점수를 응답 전체에 대해 한 번에 계산합니다.
 
-    선택 기준:
+    점수 기준:
     1. 가장 구체적이고 완전한 문장
     2. 길이가 적절한 문장 (너무 짧지 않은)
     3. 문장 구조가 완전한 것
     """
-    if not responses:
-        return ''
+    n = len(responses)
 
-    if len(responses) == 1:
-        return responses[0]
+    # 길이 점수 (너무 짧거나 너무 긴 것은 감점)
+    lengths = np.fromiter((len(resp) for resp in responses), dtype=np.int64, count=n)
+    scores = np.select(
+        [(lengths >= 10) & (lengths <= 100), lengths > 100, lengths >= 5], [30, 20, 10], default=0
+    )
 
-    # 점수 계산
-    scored = []
-    for resp in responses:
-        score = 0
+    # 키워드 다양성 점수
+    scores += 5 * np.asarray(keyword_counts, dtype=np.int64)
 
-        # 길이 점수 (너무 짧거나 너무 긴 것은 감점)
-        length = len(resp)
-        if 10 <= length <= 100:
-            score += 30
-        elif length > 100:
-            score += 20
-        elif length >= 5:
-            score += 10
+    # 문장 완결성 점수 (어미가 있으면)
+    scores += 10 * np.fromiter(
+        (_COMPLETE_ENDING_RE.search(resp) is not None for resp in responses), dtype=np.int64, count=n
+    )
 
-        # 키워드 다양성 점수
-        keywords = extract_keywords(resp)
-        score += len(keywords) * 5
+    # 구체적 표현 점수
+    scores += 5 * np.fromiter(
+        (sum(pattern in resp for pattern in CONCRETE_PATTERNS) for resp in responses),
+        dtype=np.int64, count=n,
+    )
 
-        # 문장 완결성 점수 (어미가 있으면)
-        if re.search(r'(음|함|됨|임)$', resp):
-            score += 10
+    return scores
 
-        # 구체적 표현 점수
-        concrete_patterns = ['통해', '배울', '알게', '이해', '향상', '느낌', '느낌', '경험']
-        for pattern in concrete_patterns:
-            if pattern in resp:
-                score += 5
 
-        scored.append((resp, score))
+def select_representative(responses: List[str]) -> str:
+    """통합된 응답 중 대표 문장(점수가 가장 높은 첫 응답)을 선택합니다."""
+    if not responses:
+        return ''
 
-    # 점수 높은 순 정렬
-    scored.sort(key=lambda x: x[1], reverse=True)
+    if len(responses) == 1:
+        return responses[0]
 
-    return scored[0][0]
+    scores = representative_scores(
+        responses, [len(extract_keywords(resp)) for resp in responses]
+    )
+    return responses[int(np.argmax(scores))]
 
 
 def should_merge(resp1: str, resp2: str, threshold: float = 0.4) -> bool:
@@ -236,52 +371,72 @@ def should_merge(resp1: str, resp2: str, threshold: float = 0.4) -> bool:
     - 동의어 관계
     - 짧은 응답이 긴 응답에 포함됨
     """
+    return _should_merge(build_similarity_context([resp1, resp2]), 0, 1, threshold)
+
+
+def _should_merge(context: Dict, i: int, j: int, threshold: float = 0.4) -> bool:
+    """미리 계산된 키워드 정보로 i번째와 j번째 응답의 통합 여부를 판단합니다."""
     # 1. 동의어 관계 확인 (가장 먼저)
-    if are_synonyms(resp1, resp2):
+    if not context['synonym_ids'][i].isdisjoint(context['synonym_ids'][j]):
         return True
 
     # 2. 짧은 응답이 긴 응답에 포함되는지 확인
-    if is_short_response(resp1) and not is_short_response(resp2):
-        if short_contained_in_long(resp1, resp2):
-            return True
-    elif is_short_response(resp2) and not is_short_response(resp1):
-        if short_contained_in_long(resp2, resp1):
+    # (둘 다 짧은 응답이면 동의어/유사도 기반으로 판단 - 동의어는 1에서 확인함)
+    short1 = context['is_short'][i]
+    short2 = context['is_short'][j]
+    if short1 and not short2:
+        if _short_contained_in_long(context, i, j):
             return True
-    elif is_short_response(resp1) and is_short_response(resp2):
-        # 둘 다 짧은 응답이면 동의어/유사도 기반 통합
-        if are_synonyms(resp1, resp2):
+    elif short2 and not short1:
+        if _short_contained_in_long(context, j, i):
             return True
 
     # 3. 주제 그룹 확인
-    groups1 = set(get_topic_group(resp1))
-    groups2 = set(get_topic_group(resp2))
-
     # 동일 주제 그룹에 속하면 통합 가능성 높음
-    if groups1 & groups2:
+    same_topic = not context['topics'][i].isdisjoint(context['topics'][j])
+    if same_topic:
         threshold = 0.25  # 임계값 더 낮춤
 
     # 4. 유사도 계산
-    similarity = calculate_similarity(resp1, resp2)
+    similarity = _calculate_similarity(context, i, j)
 
     if similarity >= threshold:
         return True
 
     # 5. 키워드 겹침 확인
-    kw1 = extract_keywords(resp1)
-    kw2 = extract_keywords(resp2)
+    common, _, _ = _pair_overlap(context, i, j)
 
     # 핵심 키워드가 1개 이상 겹치고, 같은 주제 그룹이면 통합
-    common = kw1 & kw2
-    if len(common) >= 1 and (groups1 & groups2):
+    if common >= 1 and same_topic:
         return True
 
     # 핵심 키워드가 2개 이상 겹치면 통합
-    if len(common) >= 2:
+    if common >= 2:
         return True
 
     return False
 
 
+def _find(parent: List[int], i: int) -> int:
+    """disjoint-set에서 i가 속한 집합의 루트를 찾습니다 (경로 압축)."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent: List[int], size: List[int], a: int, b: int) -> None:
+    """a와 b가 속한 두 집합을 합칩니다 (크기가 큰 쪽을 루트로)."""
+    root_a = _find(parent, a)
+    root_b = _find(parent, b)
+    if root_a == root_b:
+        return
+    if size[root_a] < size[root_b]:
+        root_a, root_b = root_b, root_a
+    parent[root_b] = root_a
+    size[root_a] += size[root_b]
+
+
 def integrate_responses(
     responses: List[str],
     similarity_threshold: float = 0.4
@@ -295,107 +450,104 @@ def integrate_responses(
     Returns:
         통합된 결과 리스트
         [{'representative': '대표문장', 'count': n, 'sources': [원본들]}, ...]
+        (count는 중복 응답을 포함한 원본 응답 수, sources는 고유 응답 목록)
     """
     if not responses:
         return []
 
-    # 중복 제거 (정확히 동일한 응답)
-    unique_responses = list(dict.fromkeys(responses))
+    # 중복 제거 (정확히 동일한 응답) - 통합은 고유 응답끼리만 하고 빈도는 중복 수만큼 반영
+    response_counts = Counter(responses)
+    unique_responses = list(response_counts)
+    weights = np.fromiter(response_counts.values(), dtype=np.int64, count=len(unique_responses))
+
+    # 응답별 파생 값과 키워드/bigram postings를 미리 계산
+    context = build_similarity_context(unique_responses)
 
-    # 그룹 초기화
-    groups = []
-    used = set()
+    # 대표 문장 점수는 응답마다 한 번만 계산하고, 그룹에서는 최고점(동점이면 앞) 응답을 선택
+    scores = representative_scores(unique_responses, context['keyword_index'].sizes)
+
+    n = len(unique_responses)
+
+    # 통합 관계는 disjoint-set으로 관리하고, 1차 그룹 번호는 응답별 배열로 기록
+    # (그룹마다 dict/list를 만들지 않고 응답 인덱스 기준의 배열만 사용)
+    parent = list(range(n))
+    size = [1] * n
+    group_of = np.full(n, -1, dtype=np.int64)
+    num_groups = 0
 
     # 주제별로 먼저 그룹핑
     topic_groups = defaultdict(list)
     no_topic = []
 
-    for i, resp in enumerate(unique_responses):
-        topics = get_topic_group(resp)
+    for i, topics in enumerate(context['topics']):
         if topics:
-            for topic in topics:
-                topic_groups[topic].append((i, resp))
+            for topic in KEYWORD_GROUPS:
+                if topic in topics:
+                    topic_groups[topic].append(i)
         else:
-            no_topic.append((i, resp))
-
-    # 주제 그룹 내에서 통합
-    for topic, items in topic_groups.items():
-        for i, resp in items:
-            if i in used:
-                continue
-
-            group = {
-                'sources': [resp],
-                'indices': [i],
-            }
-            used.add(i)
-
-            # 같은 주제 내에서 유사한 응답 찾기
-            for j, other in items:
-                if j in used:
-                    continue
-
-                if should_merge(resp, other, similarity_threshold):
-                    group['sources'].append(other)
-                    group['indices'].append(j)
-                    used.add(j)
-
-            groups.append(group)
-
-    # 주제 없는 응답 처리
-    for i, resp in no_topic:
-        if i in used:
+            no_topic.append(i)
+
+    # 주제 그룹 내에서 통합한 뒤, 주제 없는 응답끼리 통합
+    # (각 묶음 안에서 아직 그룹이 없는 첫 응답을 기준으로 유사한 응답을 모음)
+    for items in [*topic_groups.values(), no_topic]:
+        # 비교 후보는 묶음 안에서 아직 그룹이 없는 응답뿐이므로 남은 목록만 유지
+        remaining = [i for i in items if group_of[i] < 0]
+
+        while remaining:
+            i = remaining[0]
+            group_of[i] = num_groups
+
+            rest = []
+            for j in remaining[1:]:
+                if _should_merge(context, i, j, similarity_threshold):
+                    group_of[j] = num_groups
+                    _union(parent, size, i, j)
+                else:
+                    rest.append(j)
+
+            num_groups += 1
+            remaining = rest
+
+    # 1차 그룹별 구성원: 그룹 번호로 안정 정렬한 응답 인덱스를 구간으로 나눔
+    # (그룹 안에서는 응답 순서 = 기준 응답이 맨 앞)
+    order = np.argsort(group_of, kind='stable')
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(group_of, minlength=num_groups))))
+    first_groups = [order[offsets[g]:offsets[g + 1]] for g in range(num_groups)]
+
+    # 그룹 간 추가 통합 (2차 통합): 1차 그룹의 대표 문장끼리 비교
+    rep_indices = [int(members[np.argmax(scores[members])]) for members in first_groups]
+    absorbed = [False] * num_groups
+
+    for gi, rep1 in enumerate(rep_indices):
+        if absorbed[gi]:
             continue
 
-        group = {
-            'sources': [resp],
-            'indices': [i],
-        }
-        used.add(i)
-
-        # 다른 주제 없는 응답과 통합 시도
-        for j, other in no_topic:
-            if j in used:
+        for gj in range(gi + 1, num_groups):
+            if absorbed[gj]:
                 continue
 
-            if should_merge(resp, other, similarity_threshold):
-                group['sources'].append(other)
-                group['indices'].append(j)
-                used.add(j)
-
-        groups.append(group)
+            if _should_merge(context, rep1, rep_indices[gj], similarity_threshold + 0.1):
+                absorbed[gj] = True
+                _union(parent, size, first_groups[gi][0], first_groups[gj][0])
 
-    # 그룹 간 추가 통합 시도 (2차 통합)
-    merged_groups = []
-    group_used = set()
-
-    for i, group1 in enumerate(groups):
-        if i in group_used:
-            continue
-
-        merged = group1.copy()
-        merged['sources'] = list(group1['sources'])
-
-        for j, group2 in enumerate(groups):
-            if j <= i or j in group_used:
-                continue
-
-            # 대표 문장 간 유사도 확인
-            rep1 = select_representative(group1['sources'])
-            rep2 = select_representative(group2['sources'])
-
-            if should_merge(rep1, rep2, similarity_threshold + 0.1):
-                merged['sources'].extend(group2['sources'])
-                group_used.add(j)
-
-        group_used.add(i)
-        merged_groups.append(merged)
+    # 최종 그룹 구성 (1차 그룹 순서대로 원본을 모음)
+    merged_groups = defaultdict(list)
+    for gi, members in enumerate(first_groups):
+        merged_groups[_find(parent, int(members[0]))].append(gi)
 
     # 최종 결과 생성
     results = []
-    for group in merged_groups:
-        representative = select_representative(group['sources'])
-        count = len(group['sources'])
+    for group_ids in merged_groups.values():
+        # 2차 통합되지 않은 그룹은 앞에서 구한 대표 문장을 그대로 사용
+        if len(group_ids) == 1:
+            members = first_groups[group_ids[0]]
+            representative = unique_responses[rep_indices[group_ids[0]]]
+        else:
+            members = np.concatenate([first_groups[gi] for gi in group_ids])
+            representative = unique_responses[members[np.argmax(scores[members])]]
+
+        sources = [unique_responses[k] for k in members]
+        count = int(weights[members].sum())
 
         # 공통의견 표기 (2개 이상일 때만)
         if count >= 2:
@@ -407,7 +559,7 @@ def integrate_responses(
             'representative': representative,
             'display': display,
             'count': count,
-            'sources': group['sources'],
+            'sources': sources,
         })
 
     # 빈도순 정렬 (높은 순)
@@ -439,5 +591,5 @@ if __name__ == '__main__':
     print("=== 통합 결과 ===")
     for r in results:
         print(f"  - {r['display']}")
-        if r['count'] > 1:
+        if len(r['sources']) > 1:
             print(f"    원본: {r['sources']}")
@@ -8,11 +8,25 @@
 4. 복합 응답 분리 (명백히 다른 주제 2개 이상인 경우)
 """
 
+import os
 import re
+import sys
+import functools
+import multiprocessing
 import pandas as pd
-from pathlib import Path
-from typing import List, Dict, Tuple
-import chardet
+from typing import Callable, List, Dict, Iterable, Tuple
+
+if __package__:
+    from ..common.parallel import parallel_map
+else:
+    # 스크립트로 직접 실행할 때(자체 테스트)는 프로젝트 루트를 path에 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.common.parallel import parallel_map
+
+
+# 고유 응답이 이 수 이상일 때만 여러 프로세스로 나눠 전처리
+# (적을 때는 프로세스 생성 비용이 전처리 시간보다 큼)
+PARALLEL_MIN_RESPONSES = 20000
 
 
 # 무의미 응답 패턴
@@ -135,11 +149,58 @@ SPLIT_PATTERNS = [
 ]
 
 
-def detect_encoding(file_path: Path) -> str:
-    """파일의 인코딩을 감지합니다."""
-    with open(file_path, 'rb') as f:
-        result = chardet.detect(f.read())
-    return result['encoding']
+def _compile_rules(rules: List[Tuple[str, str]]) -> List[Tuple[re.Pattern, str]]:
+    """(패턴, 대체 문자열) 규칙의 패턴을 미리 컴파일합니다."""
+    return [(re.compile(pattern), replacement) for pattern, replacement in rules]
+
+
+# 응답마다 re 캐시를 조회하지 않도록 모듈 로드 시 한 번만 컴파일
+# 무의미 응답 패턴은 하나의 alternation으로 합쳐 응답마다 한 번만 매칭
+_MEANINGLESS_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in MEANINGLESS_PATTERNS), re.IGNORECASE
+)
+_SPACING_RULES = _compile_rules(SPACING_RULES)
+_TYPO_RULES = _compile_rules(TYPO_RULES)
+
+# 문장 중간/끝 어미 규칙을 하나의 alternation으로 합쳐 한 번의 스캔으로 변환
+# (같은 위치에서는 앞에 나열된 규칙이 우선 - 순차 적용과 같은 결과)
+_ENDING_REPLACEMENTS = {
+    f'r{i}': replacement
+    for i, (_, replacement) in enumerate(MID_SENTENCE_RULES + ENDING_RULES)
+}
+_ENDING_RE = re.compile('|'.join(
+    f'(?P<r{i}>{pattern})'
+    for i, (pattern, _) in enumerate(MID_SENTENCE_RULES + ENDING_RULES)
+))
+
+
+def _rule_match_length(pattern: str, suffix: str) -> int:
+    """어미 규칙 패턴이 맞출 수 있는 최대 글자 수를 구합니다.
+
+    어미 규칙은 '리터럴 + \\. / \\.? / $' 형태만 허용하며, 스캔 범위가 맞도록
+    패턴이 suffix(문장 중간 규칙은 '\\.', 문장 끝 규칙은 '$')로 끝나야 합니다.
+    """
+    if not pattern.endswith(suffix):
+        raise ValueError(f'어미 규칙은 {suffix!r}로 끝나야 합니다: {pattern}')
+    literal = pattern.removesuffix('$').replace('\\.?', '.').replace('\\.', '.')
+    if re.search(r'[\\\[\](){}*+?|^$]', literal):
+        raise ValueError(f'어미 규칙은 리터럴 패턴이어야 합니다: {pattern}')
+    return len(literal)
+
+
+# 어미 규칙은 마침표로 끝나거나(문장 중간) 문장 끝에서만 맞으므로,
+# 첫 마침표와 문장 끝에서 규칙 최대 길이만큼 앞쪽부터만 스캔하면 됨
+_MID_SENTENCE_MAX_LEN = max(_rule_match_length(pattern, '\\.') for pattern, _ in MID_SENTENCE_RULES)
+_ENDING_MAX_LEN = max(_rule_match_length(pattern, '$') for pattern, _ in ENDING_RULES)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPLIT_INDICATOR_RE = re.compile(
+    r'(했고|었고|았고|였고|이고|하고)[,\s]+(강사|교수|선생|운영|진행|시설|장소|음식|식사)'
+)
+_DIFFERENT_TOPICS_RE = re.compile(r'(좋았고|유익했고|도움됐고)[,\s]+(또한|그리고|추가로)')
+_SPLIT_RE = re.compile(
+    r'(했고|었고|았고|였고)[,\s]+(?=강사|교수|선생|운영|진행|시설|장소|음식|식사)'
+)
 
 
 def is_meaningless(text: str) -> bool:
@@ -149,14 +210,7 @@ def is_meaningless(text: str) -> bool:
 
     text = str(text).strip()
 
-    if not text:
-        return True
-
-    for pattern in MEANINGLESS_PATTERNS:
-        if re.match(pattern, text, re.IGNORECASE):
-            return True
-
-    return False
+    return not text or bool(_MEANINGLESS_RE.match(text))
 
 
 def fix_spacing(text: str) -> str:
@@ -166,11 +220,11 @@ def fix_spacing(text: str) -> str:
 
     result = str(text)
 
-    for pattern, replacement in SPACING_RULES:
-        result = re.sub(pattern, replacement, result)
+    for pattern, replacement in _SPACING_RULES:
+        result = pattern.sub(replacement, result)
 
     # 다중 공백 정리
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = _WHITESPACE_RE.sub(' ', result).strip()
 
     return result
 
@@ -182,8 +236,8 @@ def fix_typos(text: str) -> str:
 
     result = str(text)
 
-    for pattern, replacement in TYPO_RULES:
-        result = re.sub(pattern, replacement, result)
+    for pattern, replacement in _TYPO_RULES:
+        result = pattern.sub(replacement, result)
 
     return result
 
@@ -195,13 +249,17 @@ def normalize_ending(text: str) -> str:
 
     result = str(text).strip()
 
-    # 1. 문장 중간 어미 변환 먼저 적용 (마침표가 있는 경우)
-    for pattern, replacement in MID_SENTENCE_RULES:
-        result = re.sub(pattern, replacement, result)
+    # 문장 중간 어미(마침표가 있는 경우)와 문장 끝 어미를 한 번에 변환
+    # 대부분의 응답은 끝부분에서만 규칙이 맞으므로 그 앞은 스캔하지 않음
+    start = len(result) - _ENDING_MAX_LEN
+    first_period = result.find('.')
+    if first_period >= 0:
+        start = min(start, first_period - _MID_SENTENCE_MAX_LEN + 1)
+    start = max(start, 0)
 
-    # 2. 문장 끝 어미 변환 적용
-    for pattern, replacement in ENDING_RULES:
-        result = re.sub(pattern, replacement, result)
+    result = result[:start] + _ENDING_RE.sub(
+        lambda m: _ENDING_REPLACEMENTS[m.lastgroup], result[start:]
+    )
 
     # 마침표로 끝나는 경우 제거
     if result.endswith('.'):
@@ -229,19 +287,13 @@ def should_split(text: str) -> bool:
 
     # 분리 키워드 패턴
     # "~했고," 또는 "~었고," 뒤에 새로운 주제가 시작되는 경우
-    split_indicator = re.search(
-        r'(했고|었고|았고|였고|이고|하고)[,\s]+(강사|교수|선생|운영|진행|시설|장소|음식|식사)',
-        text
-    )
+    split_indicator = _SPLIT_INDICATOR_RE.search(text)
 
     if split_indicator:
         return True
 
     # 명백히 다른 주제를 나열하는 패턴
-    different_topics = re.search(
-        r'(좋았고|유익했고|도움됐고)[,\s]+(또한|그리고|추가로)',
-        text
-    )
+    different_topics = _DIFFERENT_TOPICS_RE.search(text)
 
     if different_topics:
         return True
@@ -263,10 +315,7 @@ def split_response(text: str) -> List[str]:
         return [text]
 
     # "~했고, 강사님~" 패턴 분리
-    parts = re.split(
-        r'(했고|었고|았고|였고)[,\s]+(?=강사|교수|선생|운영|진행|시설|장소|음식|식사)',
-        text
-    )
+    parts = _SPLIT_RE.split(text)
 
     if len(parts) >= 2:
         results = []
@@ -314,17 +363,53 @@ def preprocess_single(text: str) -> str:
     return result
 
 
+def _apply_chunk(func: Callable, values: List) -> List:
+    """값 목록에 func를 차례로 적용합니다 (프로세스 간 전달용)."""
+    return [func(value) for value in values]
+
+
+def _map_distinct(series: pd.Series, func: Callable) -> pd.Series:
+    """같은 응답은 한 번만 계산하도록 고유값에 func를 적용한 뒤 원래 위치로 펼칩니다.
+
+    고유값이 PARALLEL_MIN_RESPONSES개 이상이면 CPU 수만큼 나눠 병렬로 처리합니다.
+    이미 파일별 작업 프로세스 안에서 실행 중이면 프로세스를 더 만들지 않습니다.
+    """
+    codes, uniques = pd.factorize(series)
+    values = list(uniques)
+
+    workers = os.cpu_count() or 1
+    in_worker = multiprocessing.parent_process() is not None
+    if len(values) >= PARALLEL_MIN_RESPONSES and workers > 1 and not in_worker:
+        size = -(-len(values) // workers)
+        chunks = [values[k:k + size] for k in range(0, len(values), size)]
+        mapped = [
+            result
+            for chunk_results in parallel_map(functools.partial(_apply_chunk, func), chunks)
+            for result in chunk_results
+        ]
+    else:
+        mapped = _apply_chunk(func, values)
+
+    results = pd.Series(mapped, dtype=object)
+    return pd.Series(results.to_numpy()[codes], index=series.index, dtype=object)
+
+
 def preprocess_responses(
-    responses: List[str]
+    responses: Iterable[str]
 ) -> Tuple[List[str], Dict]:
-    """응답 리스트를 전처리합니다.
+    """응답들을 전처리합니다.
+
+    중복 응답이 많으므로 고유 응답 단위로 한 번씩만 전처리합니다.
 
     Args:
-        responses: 원본 응답 리스트
+        responses: 원본 응답 (pandas Series, 리스트 등 순회 가능한 객체)
 
     Returns:
         (전처리된 응답 리스트, 통계 딕셔너리)
     """
+    if not isinstance(responses, pd.Series):
+        responses = pd.Series(list(responses), dtype=object)
+
     stats = {
         'original_count': len(responses),
         'removed_meaningless': 0,
@@ -332,32 +417,26 @@ def preprocess_responses(
         'final_count': 0,
     }
 
-    processed = []
-
-    for resp in responses:
-        # 무의미 응답 제거
-        if is_meaningless(resp):
-            stats['removed_meaningless'] += 1
-            continue
-
-        # 전처리
-        cleaned = preprocess_single(resp)
-
-        if not cleaned:
-            stats['removed_meaningless'] += 1
-            continue
+    # 무의미 응답 제거 (결측값 포함)
+    texts = responses[responses.notna()]
+    texts = texts[~_map_distinct(texts, is_meaningless).astype(bool)]
 
-        # 복합 응답 분리
-        parts = split_response(cleaned)
+    # 전처리 후 빈 응답도 무의미 응답으로 집계
+    cleaned = _map_distinct(texts, preprocess_single)
+    cleaned = cleaned[cleaned != '']
+    stats['removed_meaningless'] = stats['original_count'] - len(cleaned)
 
-        if len(parts) > 1:
-            stats['split_count'] += len(parts) - 1
+    # 복합 응답 분리
+    parts = []
+    for split_parts in _map_distinct(cleaned, split_response):
+        if len(split_parts) > 1:
+            stats['split_count'] += len(split_parts) - 1
+        parts.extend(split_parts)
 
-        for part in parts:
-            part_cleaned = preprocess_single(part)
-            if part_cleaned and not is_meaningless(part_cleaned):
-                processed.append(part_cleaned)
+    parts = _map_distinct(pd.Series(parts, dtype=object), preprocess_single)
+    parts = parts[(parts != '') & ~_map_distinct(parts, is_meaningless).astype(bool)]
 
+    processed = parts.tolist()
     stats['final_count'] = len(processed)
 
     return processed, stats
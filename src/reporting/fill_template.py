@@ -8,10 +8,26 @@
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from openpyxl import load_workbook
 from difflib import SequenceMatcher
 
+import numpy as np
+
+from ..common.json_utils import write_json
+from ..common.paths import DATA_DIR, TEMPLATES_DIR
+
+
+# 템플릿 열 번호 (H열: 질문, J열: 평균값)
+QUESTION_COLUMN = 8
+VALUE_COLUMN = 10
+
+# J열에 값을 입력해야 하는 행 목록 (템플릿 구조 기반)
+# Part 2: 정량 평가 (J14~J21, J17 제외 - 주관식)
+# Part 3: 과목별 평가 (J26~J37)
+J_COLUMN_ROWS = [14, 15, 16, 18, 19, 20, 21, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37]
+
 
 def normalize_text(text: str) -> str:
     """텍스트를 정규화하여 비교 가능하게 만듭니다."""
@@ -22,11 +38,81 @@ def normalize_text(text: str) -> str:
     return text.lower()
 
 
-def similarity_ratio(text1: str, text2: str) -> float:
-    """두 텍스트의 유사도를 계산합니다."""
-    norm1 = normalize_text(text1)
-    norm2 = normalize_text(text2)
-    return SequenceMatcher(None, norm1, norm2).ratio()
+def quick_ratio_matrix(texts1: list, texts2: list) -> np.ndarray:
+    """두 텍스트 목록의 모든 쌍에 대해 SequenceMatcher.quick_ratio()를 한 번에 계산합니다.
+
+    quick_ratio()는 글자 구성만 비교하는 ratio()의 상한값이므로,
+    상한이 이미 찾은 최고 점수보다 낮은 후보는 ratio()를 계산할 필요가 없습니다.
+    """
+    vocab = {}
+    for text in texts1 + texts2:
+        for ch in text:
+            vocab.setdefault(ch, len(vocab))
+
+    def char_counts(texts):
+        counts = np.zeros((len(texts), len(vocab)), dtype=np.int64)
+        for i, text in enumerate(texts):
+            np.add.at(counts[i], [vocab[ch] for ch in text], 1)
+        return counts
+
+    counts1 = char_counts(texts1)
+    counts2 = char_counts(texts2)
+
+    # 공통 글자 수 (글자별 최소 개수의 합)
+    overlap = np.minimum(counts1[:, None, :], counts2[None, :, :]).sum(axis=2)
+    total = counts1.sum(axis=1)[:, None] + counts2.sum(axis=1)[None, :]
+
+    # 둘 다 빈 문자열이면 SequenceMatcher와 같이 1.0
+    return np.divide(2.0 * overlap, total, out=np.ones(overlap.shape), where=total > 0)
+
+
+def find_best_matches(questions: list, template_questions: dict, threshold: float = 0.5) -> list:
+    """
+    여러 질문 각각에 가장 잘 매칭되는 템플릿 행을 찾습니다.
+
+    모든 (질문, 템플릿 행) 쌍의 유사도 상한을 행렬로 먼저 계산하고,
+    상한이 높은 후보부터 정확한 유사도를 계산하다가 더 나은 후보가 없으면 멈춥니다.
+    결과는 모든 행을 차례로 비교하는 것과 같습니다 (동점이면 앞 행).
+
+    Returns:
+        [(row_number, similarity_score, template_question), ...]
+    """
+    rows = list(template_questions)
+    template_texts = list(template_questions.values())
+    template_norms = [normalize_text(q) for q in template_texts]
+    question_norms = [normalize_text(q) for q in questions]
+
+    bounds = quick_ratio_matrix(question_norms, template_norms)
+
+    # SequenceMatcher는 두 번째 문자열의 색인을 캐시하므로 템플릿 질문마다 하나씩 만들어 재사용
+    matchers = [SequenceMatcher(None, '', norm) for norm in template_norms]
+
+    matches = []
+    for qi, norm1 in enumerate(question_norms):
+        best_pos = None
+        best_score = 0
+
+        for pos in np.argsort(-bounds[qi], kind='stable'):
+            bound = bounds[qi, pos]
+            if bound < threshold or bound < best_score:
+                break
+
+            matcher = matchers[pos]
+            matcher.set_seq1(norm1)
+            score = matcher.ratio()
+            if score < threshold:
+                continue
+
+            if score > best_score or (best_pos is not None and score == best_score and pos < best_pos):
+                best_score = score
+                best_pos = pos
+
+        if best_pos is None:
+            matches.append((None, 0, ""))
+        else:
+            matches.append((rows[best_pos], best_score, template_texts[best_pos]))
+
+    return matches
 
 
 def find_best_match(question: str, template_questions: dict, threshold: float = 0.5) -> tuple:
@@ -36,30 +122,58 @@ def find_best_match(question: str, template_questions: dict, threshold: float =
     Returns:
         (row_number, similarity_score, template_question)
     """
-    best_match = None
-    best_score = 0
-    best_question = ""
-
-    for row, template_q in template_questions.items():
-        score = similarity_ratio(question, template_q)
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = row
-            best_question = template_q
-
-    return best_match, best_score, best_question
+    return find_best_matches([question], template_questions, threshold)[0]
 
 
 def extract_template_questions(ws, j_column_rows: list) -> dict:
     """템플릿에서 J열에 값을 입력해야 하는 행들의 질문(H열)을 추출합니다."""
+    if not j_column_rows:
+        return {}
+
+    # 좌표 문자열 파싱 없이 H열 범위를 한 번에 읽음
+    min_row = min(j_column_rows)
+    h_values = [
+        value for (value,) in ws.iter_rows(
+            min_row=min_row, max_row=max(j_column_rows),
+            min_col=QUESTION_COLUMN, max_col=QUESTION_COLUMN, values_only=True,
+        )
+    ]
+
     questions = {}
     for row in j_column_rows:
-        h_value = ws[f'H{row}'].value
+        h_value = h_values[row - min_row]
         if h_value:
             questions[row] = str(h_value)
     return questions
 
 
+@lru_cache(maxsize=4)
+def _load_template_cached(path: str, mtime_ns: int) -> tuple:
+    """템플릿 워크북과 J열 원래 값을 불러옵니다 (경로, 수정 시각 기준 캐시)."""
+    wb = load_workbook(path)
+    ws = wb.active
+    original_values = {
+        row: ws.cell(row=row, column=VALUE_COLUMN).value for row in J_COLUMN_ROWS
+    }
+    return wb, original_values
+
+
+def load_template(template_path: Path):
+    """템플릿 워크북을 불러옵니다.
+
+    템플릿 로드(스타일 파싱)가 채우기 작업 대부분을 차지하므로, 같은 프로세스에서
+    같은 템플릿을 다시 쓸 때는 로드한 워크북을 재사용하고 J열만 원래 값으로 되돌립니다.
+    """
+    wb, original_values = _load_template_cached(
+        str(template_path), template_path.stat().st_mtime_ns
+    )
+    ws = wb.active
+    for row, value in original_values.items():
+        # ws.cell(..., value=None)은 값을 바꾸지 않으므로 직접 대입해야 빈 칸으로 되돌아감
+        ws.cell(row=row, column=VALUE_COLUMN).value = value
+    return wb
+
+
 def fill_template(template_path: Path, results: dict, output_path: Path) -> dict:
     """
     템플릿 파일에 분석 결과를 입력합니다.
@@ -67,34 +181,31 @@ def fill_template(template_path: Path, results: dict, output_path: Path) -> dict
     Returns:
         매핑 결과 딕셔너리 (검토용)
     """
-    wb = load_workbook(template_path)
+    wb = load_template(template_path)
     ws = wb.active
 
-    # J열에 값을 입력해야 하는 행 목록 (템플릿 구조 기반)
-    # Part 2: 정량 평가 (J14~J21, J17 제외 - 주관식)
-    # Part 3: 과목별 평가 (J26~J37)
-    j_column_rows = [14, 15, 16, 18, 19, 20, 21, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37]
-
     # 템플릿에서 질문 추출
-    template_questions = extract_template_questions(ws, j_column_rows)
+    template_questions = extract_template_questions(ws, J_COLUMN_ROWS)
 
     # 매핑 결과 저장 (검토용)
     mapping_results = {
         'matched': [],
         'unmatched_survey': [],
-        'unmatched_template': list(j_column_rows)
+        'unmatched_template': list(J_COLUMN_ROWS)
     }
 
-    # 각 설문 문항에 대해 매핑 시도
-    for q_stats in results['questions']:
+    # 모든 설문 문항을 한 번에 매핑
+    matches = find_best_matches(
+        [q_stats['question'] for q_stats in results['questions']], template_questions
+    )
+
+    for q_stats, (row, score, template_q) in zip(results['questions'], matches):
         question = q_stats['question']
         mean_value = q_stats['mean']
 
-        row, score, template_q = find_best_match(question, template_questions)
-
         if row:
             # 매핑 성공 - J열에 값 입력
-            ws[f'J{row}'] = mean_value
+            ws.cell(row=row, column=VALUE_COLUMN, value=mean_value)
             mapping_results['matched'].append({
                 'row': row,
                 'survey_question': question[:80],
@@ -153,34 +264,38 @@ def print_verification_report(mapping_results: dict, output_path: Path):
 
     # 검토 리포트 파일로도 저장
     report_path = output_path.parent / (output_path.stem + '_검토리포트.json')
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(mapping_results, f, ensure_ascii=False, indent=2)
+    write_json(report_path, mapping_results)
     print(f"검토 리포트: {report_path}")
 
 
+def find_template() -> Path:
+    """templates 폴더에서 사용할 템플릿 파일을 찾습니다 (없으면 None)."""
+    template_files = list(TEMPLATES_DIR.glob('*.xlsx'))
+    if not template_files:
+        print("템플릿 파일이 없습니다.")
+        print(f"  템플릿 폴더: {TEMPLATES_DIR}")
+        return None
+
+    return template_files[0]  # 첫 번째 템플릿 사용
+
+
 def process_all_results(work_folder: str):
     """작업 폴더의 results 폴더 결과를 템플릿에 입력합니다.
 
     Args:
         work_folder: 작업 폴더명 (예: '2024_상반기_신입사원_입문과정')
     """
-    base_dir = Path(__file__).parent.parent.parent
-    templates_dir = base_dir / 'templates'
-
-    work_dir = base_dir / 'data' / work_folder
+    work_dir = DATA_DIR / work_folder
 
     if not work_dir.exists():
         print(f"작업 폴더가 존재하지 않습니다: {work_folder}")
         return
 
     # 템플릿 파일 찾기
-    template_files = list(templates_dir.glob('*.xlsx'))
-    if not template_files:
-        print("템플릿 파일이 없습니다.")
-        print(f"  템플릿 폴더: {templates_dir}")
+    template_path = find_template()
+    if template_path is None:
         return
 
-    template_path = template_files[0]  # 첫 번째 템플릿 사용
     print(f"템플릿: {template_path.name}\n")
 
     results_dir = work_dir / 'results'
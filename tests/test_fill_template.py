@@ -0,0 +1,56 @@
+"""
+템플릿 채우기 회귀 테스트
+
+실행: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.reporting.fill_template import (
+    J_COLUMN_ROWS, VALUE_COLUMN, extract_template_questions, fill_template, find_template,
+)
+
+
+class FillTemplateReuseTest(unittest.TestCase):
+    """같은 프로세스에서 템플릿을 연달아 채울 때 이전 결과가 남지 않는지 확인합니다."""
+
+    def setUp(self):
+        self.template_path = find_template()
+        if self.template_path is None:
+            self.skipTest("템플릿 파일이 없습니다.")
+
+        ws = load_workbook(self.template_path).active
+        self.questions = extract_template_questions(ws, J_COLUMN_ROWS)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = Path(temp_dir.name)
+
+    def test_rows_from_previous_fill_are_cleared(self):
+        first = {'questions': [
+            {'question': self.questions[14], 'mean': 4.1},
+            {'question': self.questions[37], 'mean': 4.5},
+        ]}
+        second = {'questions': [
+            {'question': self.questions[14], 'mean': 3.9},
+        ]}
+
+        fill_template(self.template_path, first, self.output_dir / 'first.xlsx')
+        mapping = fill_template(self.template_path, second, self.output_dir / 'second.xlsx')
+
+        ws = load_workbook(self.output_dir / 'second.xlsx').active
+        self.assertEqual(ws.cell(row=14, column=VALUE_COLUMN).value, 3.9)
+        self.assertIsNone(ws.cell(row=37, column=VALUE_COLUMN).value)
+        self.assertIn(37, mapping['unmatched_template'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+주관식 통합 결과 저장 회귀 테스트
+
+실행: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import load_workbook
+
+# 프로젝트 루트와 scripts 폴더를 path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'scripts'))
+
+from run_qualitative import make_sheet_name, process_file
+
+
+class SheetNameTest(unittest.TestCase):
+    """질문 헤더로 만든 시트명이 Excel 규칙을 지키는지 확인합니다."""
+
+    def test_quoted_header_is_stripped(self):
+        self.assertEqual(make_sheet_name("'리더십 과정'에서 좋았던 점", set()), "리더십 과정'에서 좋았던 점")
+
+    def test_empty_name_falls_back_to_default(self):
+        self.assertEqual(make_sheet_name("'[]'", set()), '질문')
+
+    def test_case_only_duplicates_get_suffix(self):
+        used = {'요약'}
+        self.assertEqual(make_sheet_name('Good points', used), 'Good points')
+        self.assertEqual(make_sheet_name('good POINTS', used), 'good POINTS (2)')
+        self.assertEqual(make_sheet_name('요약', used), '요약 (2)')
+
+    def test_suffix_keeps_31_character_limit(self):
+        used = set()
+        make_sheet_name('가' * 40, used)
+        self.assertEqual(len(make_sheet_name('가' * 40, used)), 31)
+
+
+class ProcessFileExcelTest(unittest.TestCase):
+    """따옴표로 시작하거나 대소문자만 다른 헤더가 있어도 Excel 저장이 되는지 확인합니다."""
+
+    def test_excel_saved_with_awkward_headers(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        work_dir = Path(temp_dir.name)
+
+        responses = [
+            "시간이 너무 짧았음",
+            "강사님의 설명이 이해하기 쉬웠습니다",
+            "현장 견학이 가장 기억에 남음",
+            "목표 설정 방법을 배웠음",
+        ] * 2
+        input_path = work_dir / 'survey.csv'
+        pd.DataFrame({
+            "'리더십 과정'에서 좋았던 점": responses,
+            'Good points': responses[1:] + responses[:1],
+            'good POINTS': responses[2:] + responses[:2],
+        }).to_csv(input_path, index=False, encoding='utf-8-sig')
+
+        process_file(input_path, work_dir / 'qualitative')
+
+        wb = load_workbook(work_dir / 'qualitative' / 'survey_통합결과.xlsx')
+        self.assertEqual(
+            wb.sheetnames,
+            ['요약', "리더십 과정'에서 좋았던 점", 'Good points', 'good POINTS (2)'],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()